@@ -10,32 +10,44 @@ Example: python3 count_words.py words.txt 5
 """
 
 import heapq
+import mmap
 import sys
-import re
 from collections import Counter
+from operator import itemgetter
 
-
-def clean_word(word):
-    """Clean word by removing punctuation and converting to lowercase"""
-    # Remove punctuation and convert to lowercase
-    cleaned = re.sub(r'[^a-zA-Z]', '', word).lower()
-    return cleaned
+# 256-entry lookup table precomputed at import time: uppercase ASCII
+# maps to lowercase and every other non-alphabetic byte maps to a space,
+# so one bytes.translate call lowercases and strips punctuation together
+_CLEAN_TABLE = bytes(
+    c + 32 if 65 <= c <= 90 else (c if 97 <= c <= 122 else 32)
+    for c in range(256)
+)
 
 
 def read_words_from_file(filename):
-    """Read and clean words from file"""
-    words = []
-    
+    """
+    Read and clean words from file
+
+    Words are returned as ASCII bytes objects - the whole pipeline stays
+    in bytes, where translate is a plain per-byte table lookup with no
+    Unicode width handling. Use word.decode() when displaying results.
+    """
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            for line in file:
-                # Split line into words and clean each word
-                line_words = line.strip().split()
-                for word in line_words:
-                    cleaned_word = clean_word(word)
-                    if cleaned_word:  # Only add non-empty words
-                        words.append(cleaned_word)
-        
+        with open(filename, 'rb') as file:
+            try:
+                # Memory-map the file so the kernel pages it in on
+                # demand (and straight from the page cache on re-runs)
+                # instead of copying it through a read() buffer
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = mm[:]
+            except ValueError:
+                # mmap rejects zero-length files
+                data = file.read()
+
+        # Lowercase and replace punctuation/digits with spaces in one
+        # translate, then tokenize in bulk; both calls run entirely in C
+        words = data.translate(_CLEAN_TABLE).split()
+
         print(f"Successfully read {len(words)} words from {filename}")
         return words
     
@@ -52,41 +64,42 @@ def count_word_frequencies(words):
     return Counter(words)
 
 
+def k_most_frequent_words(word_freq, k):
+    """
+    Find k most frequent words using Counter.most_common
+
+    most_common(k) runs the same min-heap-of-size-k algorithm as the
+    manual version below, but entirely inside C (heapq.nlargest), so
+    no Python-level work happens per unique word.
+
+    Time Complexity: O(n log k) where n is number of unique words
+    Space Complexity: O(k)
+    """
+    if k <= 0:
+        return []
+
+    return word_freq.most_common(k)
+
+
 def k_most_frequent_words_minheap(word_freq, k):
     """
     Find k most frequent words using min heap approach
-    
-    Algorithm:
+
+    Algorithm (performed by heapq.nlargest, in C):
     1. Use a min heap of size k
     2. For each word-frequency pair:
        - If heap size < k, add the pair
        - If current frequency > minimum frequency in heap, replace minimum
-    3. Return all elements in heap (these are the k most frequent)
-    
+    3. Return the heap contents sorted by frequency (descending)
+
     Time Complexity: O(n log k) where n is number of unique words
     Space Complexity: O(k)
     """
     if k <= 0:
         return []
-    
-    min_heap = []
-    
-    for word, freq in word_freq.items():
-        if len(min_heap) < k:
-            # Heap not full, add current word
-            heapq.heappush(min_heap, (freq, word))
-        elif freq > min_heap[0][0]:
-            # Current frequency is higher than minimum in heap
-            # Replace the minimum
-            heapq.heapreplace(min_heap, (freq, word))
-    
-    # Extract results and sort by frequency (descending)
-    result = []
-    while min_heap:
-        freq, word = heapq.heappop(min_heap)
-        result.append((word, freq))
-    
-    # Reverse to get highest frequency first
-    result.reverse()
-    return result
+
+    # nlargest runs the push/replace-min pattern described above in a
+    # single C loop and already returns results highest-frequency first,
+    # so no Python-level heap maintenance or reverse pass is needed
+    return heapq.nlargest(k, word_freq.items(), key=itemgetter(1))
 
@@ -20,38 +20,40 @@ import math
 import sys
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+
+# Interned once so the stance check in the load loop is a pointer
+# compare against this literal rather than a character-by-character
+# string comparison
+_BIPEDAL = sys.intern('bipedal')
+
 
 class DinosaurData:
     """Container for dinosaur information"""
     
-    def __init__(self, name: str, leg_length: float, stride_length: float, 
-                 diet: str, stance: str):
+    def __init__(self, name: str, leg_length: float, stride_length: float,
+                 diet: str, stance: str, speed: Optional[float] = None):
         self.name = name
         self.leg_length = leg_length
         self.stride_length = stride_length
         self.diet = diet
         self.stance = stance
-        self._speed: Optional[float] = None
-    
-    @property
-    def speed(self) -> float:
-        """Calculate and cache dinosaur speed using the given formula"""
-        if self._speed is None:
+        # Computed once here instead of lowercasing the stance string on
+        # every check
+        self.is_bipedal = sys.intern(stance.strip().casefold()) is _BIPEDAL
+
+        # Speed is a plain attribute computed eagerly (or passed in when
+        # already computed in bulk), so every later read is a bare
+        # attribute load with no lazy-initialization branch
+        if speed is None:
             g = 9.8  # gravitational constant
-            if self.leg_length <= 0:
-                raise ValueError(f"Invalid leg length for {self.name}: {self.leg_length}")
-            
+            if leg_length <= 0:
+                raise ValueError(f"Invalid leg length for {name}: {leg_length}")
+
             # speed = ((stride_length / leg_length) - 1) * sqrt(leg_length * g)
-            stride_ratio = self.stride_length / self.leg_length
-            self._speed = (stride_ratio - 1) * math.sqrt(self.leg_length * g)
-        
-        return self._speed
-    
-    @property
-    def is_bipedal(self) -> bool:
-        """Check if dinosaur is bipedal"""
-        return self.stance.lower() == 'bipedal'
-    
+            speed = ((stride_length / leg_length) - 1) * math.sqrt(leg_length * g)
+        self.speed = speed
+
     def __repr__(self) -> str:
         return (f"DinosaurData(name='{self.name}', speed={self.speed:.2f}, "
                 f"stance='{self.stance}')")
@@ -61,161 +63,225 @@ class DinosaurSpeedCalculator:
     """Main class for processing dinosaur CSV data and calculating speeds"""
     
     def __init__(self):
-        self.dinosaurs: Dict[str, DinosaurData] = {}
-    
+        # Per-file rows accumulated by the loaders, joined on name by
+        # finalize()
+        self._dataset1: Dict[str, Tuple[str, str]] = {}
+        self._dataset2: Dict[str, Tuple[str, str, bool]] = {}
+        # Structure-of-arrays storage filled by finalize(): parallel
+        # arrays are cache-friendly and let speed/sort run as numpy ops
+        self.names: List[str] = []
+        self.diets: List[str] = []
+        self.leg: np.ndarray = np.empty(0, dtype=np.float64)
+        self.stride: np.ndarray = np.empty(0, dtype=np.float64)
+        self.stance: np.ndarray = np.empty(0, dtype='<U12')
+        self.is_bipedal: np.ndarray = np.empty(0, dtype=bool)
+
     def load_dataset1(self, filepath: str) -> None:
         """
         Load dataset1.csv containing: NAME, LEG_LENGTH, DIET
         """
         try:
             with open(filepath, 'r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                
-                # Handle different possible column names
+                reader = csv.reader(file)
+
+                # Normalize column names once at header time (remove
+                # spaces, convert to uppercase) and resolve the column
+                # positions; each data row is then three index lookups
+                header = [h.strip().upper() for h in next(reader, [])]
+                name_i = self._find_column(header, ['NAME', 'DINOSAUR', 'SPECIES'])
+                leg_i = self._find_column(header, ['LEG_LENGTH', 'LEG LENGTH', 'LGLENGTH'])
+                diet_i = self._find_column(header, ['DIET', 'FOOD', 'EATING'])
+
+                if None in (name_i, leg_i, diet_i):
+                    print(f"Warning: Could not find required columns in {filepath}, header: {header}")
+                    return
+
                 for row in reader:
-                    # Normalize column names (remove spaces, convert to uppercase)
-                    normalized_row = {k.strip().upper(): v.strip() for k, v in row.items()}
-                    
-                    # Try different possible column name variations
-                    name_key = self._find_column(normalized_row, ['NAME', 'DINOSAUR', 'SPECIES'])
-                    leg_key = self._find_column(normalized_row, ['LEG_LENGTH', 'LEG LENGTH', 'LGLENGTH'])
-                    diet_key = self._find_column(normalized_row, ['DIET', 'FOOD', 'EATING'])
-                    
-                    if not all([name_key, leg_key, diet_key]):
-                        print(f"Warning: Could not find required columns in row: {row}")
-                        continue
-                    
-                    name = normalized_row[name_key]
-                    try:
-                        leg_length = float(normalized_row[leg_key])
-                    except ValueError:
-                        print(f"Warning: Invalid leg length for {name}: {normalized_row[leg_key]}")
+                    # Skip blank lines (DictReader used to do this)
+                    if not row:
                         continue
-                    
-                    diet = normalized_row[diet_key]
-                    
-                    # Store partial dinosaur data
-                    if name not in self.dinosaurs:
-                        self.dinosaurs[name] = {
-                            'name': name,
-                            'leg_length': leg_length,
-                            'diet': diet
-                        }
-                    else:
-                        self.dinosaurs[name].update({
-                            'leg_length': leg_length,
-                            'diet': diet
-                        })
-                        
+
+                    # Leg length kept as a string here; finalize()
+                    # converts the whole column to float64 in one batch
+                    self._dataset1[row[name_i].strip()] = (row[leg_i].strip(),
+                                                           row[diet_i].strip())
+
         except FileNotFoundError:
             raise FileNotFoundError(f"Could not find dataset1 file: {filepath}")
         except Exception as e:
             raise Exception(f"Error reading dataset1: {e}")
-    
+
     def load_dataset2(self, filepath: str) -> None:
         """
         Load dataset2.csv containing: NAME, STRIDE_LENGTH, STANCE
         """
         try:
             with open(filepath, 'r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                
+                reader = csv.reader(file)
+
+                # Resolve column positions from the normalized header once
+                header = [h.strip().upper() for h in next(reader, [])]
+                name_i = self._find_column(header, ['NAME', 'DINOSAUR', 'SPECIES'])
+                stride_i = self._find_column(header, ['STRIDE_LENGTH', 'STRIDE LENGTH', 'STRIDE'])
+                stance_i = self._find_column(header, ['STANCE', 'POSTURE', 'POSITION'])
+
+                if None in (name_i, stride_i, stance_i):
+                    print(f"Warning: Could not find required columns in {filepath}, header: {header}")
+                    return
+
                 for row in reader:
-                    # Normalize column names
-                    normalized_row = {k.strip().upper(): v.strip() for k, v in row.items()}
-                    
-                    # Try different possible column name variations
-                    name_key = self._find_column(normalized_row, ['NAME', 'DINOSAUR', 'SPECIES'])
-                    stride_key = self._find_column(normalized_row, ['STRIDE_LENGTH', 'STRIDE LENGTH', 'STRIDE'])
-                    stance_key = self._find_column(normalized_row, ['STANCE', 'POSTURE', 'POSITION'])
-                    
-                    if not all([name_key, stride_key, stance_key]):
-                        print(f"Warning: Could not find required columns in row: {row}")
+                    # Skip blank lines (DictReader used to do this)
+                    if not row:
                         continue
-                    
-                    name = normalized_row[name_key]
-                    try:
-                        stride_length = float(normalized_row[stride_key])
-                    except ValueError:
-                        print(f"Warning: Invalid stride length for {name}: {normalized_row[stride_key]}")
-                        continue
-                    
-                    stance = normalized_row[stance_key]
-                    
-                    # Store or update dinosaur data
-                    if name not in self.dinosaurs:
-                        self.dinosaurs[name] = {
-                            'name': name,
-                            'stride_length': stride_length,
-                            'stance': stance
-                        }
-                    else:
-                        self.dinosaurs[name].update({
-                            'stride_length': stride_length,
-                            'stance': stance
-                        })
-                        
+
+                    # Stride length kept as a string here; finalize()
+                    # converts the whole column to float64 in one batch
+                    stance = row[stance_i].strip()
+                    # Normalize the stance check once per row at load
+                    # time instead of lowercasing on every later check
+                    is_bipedal = sys.intern(stance.casefold()) is _BIPEDAL
+
+                    self._dataset2[row[name_i].strip()] = (row[stride_i].strip(),
+                                                           stance, is_bipedal)
+
         except FileNotFoundError:
             raise FileNotFoundError(f"Could not find dataset2 file: {filepath}")
         except Exception as e:
             raise Exception(f"Error reading dataset2: {e}")
-    
-    def _find_column(self, row: Dict[str, str], possible_names: List[str]) -> Optional[str]:
-        """Find a column by trying multiple possible names"""
+
+    def _find_column(self, header: List[str], possible_names: List[str]) -> Optional[int]:
+        """Find a column index in the header by trying multiple possible names"""
         for name in possible_names:
-            if name in row:
-                return name
+            if name in header:
+                return header.index(name)
         return None
-    
-    def create_dinosaur_objects(self) -> List[DinosaurData]:
+
+    def finalize(self) -> None:
         """
-        Create DinosaurData objects from loaded data
+        Convert the accumulated rows into structure-of-arrays storage
         Only include dinosaurs that have all required fields
         """
-        complete_dinosaurs = []
-        
-        for name, data in self.dinosaurs.items():
-            required_fields = ['name', 'leg_length', 'stride_length', 'diet', 'stance']
-            
-            if all(field in data for field in required_fields):
+        names: List[str] = []
+        diets: List[str] = []
+        legs: List[str] = []
+        strides: List[str] = []
+        stances: List[str] = []
+        bipedal_flags: List[bool] = []
+
+        # Hash-join the two files on name: one dict lookup per dinosaur
+        # instead of per-field membership tests on a merged partial dict
+        for name, (leg_length, diet) in self._dataset1.items():
+            extra = self._dataset2.get(name)
+            if extra is None:
+                print(f"Warning: Incomplete data for {name}, missing: "
+                      f"['stride_length', 'stance']")
+                continue
+            stride_length, stance, is_bipedal = extra
+            names.append(name)
+            diets.append(diet)
+            legs.append(leg_length)
+            strides.append(stride_length)
+            stances.append(stance)
+            bipedal_flags.append(is_bipedal)
+
+        for name in self._dataset2.keys() - self._dataset1.keys():
+            print(f"Warning: Incomplete data for {name}, missing: "
+                  f"['leg_length', 'diet']")
+
+        try:
+            # Parse each numeric column in a single C-level conversion
+            # instead of one float() call per row
+            leg = np.asarray(legs, dtype=np.float64)
+            stride = np.asarray(strides, dtype=np.float64)
+        except ValueError:
+            # Clean inputs never take this path; fall back to row-by-row
+            # parsing so a bad value only drops its own row
+            keep = []
+            for i, (leg_str, stride_str) in enumerate(zip(legs, strides)):
                 try:
-                    dinosaur = DinosaurData(
-                        name=data['name'],
-                        leg_length=data['leg_length'],
-                        stride_length=data['stride_length'],
-                        diet=data['diet'],
-                        stance=data['stance']
-                    )
-                    complete_dinosaurs.append(dinosaur)
-                except Exception as e:
-                    print(f"Warning: Could not create dinosaur object for {name}: {e}")
-            else:
-                missing = [f for f in required_fields if f not in data]
-                print(f"Warning: Incomplete data for {name}, missing: {missing}")
-        
-        return complete_dinosaurs
+                    float(leg_str)
+                    float(stride_str)
+                    keep.append(i)
+                except ValueError:
+                    print(f"Warning: Invalid numeric data for {names[i]}: "
+                          f"leg={leg_str}, stride={stride_str}")
+            names = [names[i] for i in keep]
+            diets = [diets[i] for i in keep]
+            stances = [stances[i] for i in keep]
+            bipedal_flags = [bipedal_flags[i] for i in keep]
+            leg = np.asarray([legs[i] for i in keep], dtype=np.float64)
+            stride = np.asarray([strides[i] for i in keep], dtype=np.float64)
+
+        self.names = names
+        self.diets = diets
+        self.leg = leg
+        self.stride = stride
+        self.stance = np.asarray(stances, dtype='<U12')
+        self.is_bipedal = np.asarray(bipedal_flags, dtype=bool)
     
-    def get_bipedal_dinosaurs_by_speed(self) -> List[DinosaurData]:
+    def get_bipedal_dinosaurs_by_speed(self, top_k: Optional[int] = None) -> List[DinosaurData]:
         """
         Get bipedal dinosaurs sorted by speed (fastest to slowest)
+
+        If top_k is given, only the top_k fastest dinosaurs are selected
+        and sorted - O(n + k log k) instead of sorting everything.
         """
-        all_dinosaurs = self.create_dinosaur_objects()
-        
-        # Filter for bipedal dinosaurs only
-        bipedal_dinosaurs = [d for d in all_dinosaurs if d.is_bipedal]
-        
-        if not bipedal_dinosaurs:
+        if top_k is not None and top_k <= 0:
+            return []
+
+        self.finalize()
+
+        # Filter for bipedal dinosaurs only (flags precomputed at load)
+        bipedal_mask = self.is_bipedal
+
+        if not bipedal_mask.any():
             print("Warning: No bipedal dinosaurs found in the data")
             return []
-        
-        # Sort by speed (descending - fastest first)
+
+        bipedal_indices = np.flatnonzero(bipedal_mask)
+        leg = self.leg[bipedal_indices]
+        stride = self.stride[bipedal_indices]
+
+        # Compute all speeds in one vectorized pass
         try:
-            bipedal_dinosaurs.sort(key=lambda d: d.speed, reverse=True)
+            if np.any(leg <= 0):
+                bad = int(bipedal_indices[np.argmax(leg <= 0)])
+                raise ValueError(f"Invalid leg length for {self.names[bad]}: {self.leg[bad]}")
+
+            # Leg lengths cluster into few distinct values in population
+            # data, so take sqrt(leg * g) once per distinct value and
+            # gather the results back instead of one sqrt per dinosaur
+            unique_leg, inverse = np.unique(leg, return_inverse=True)
+            sqrt_leg_g = np.sqrt(unique_leg * 9.8)[inverse]
+            speeds = ((stride / leg) - 1.0) * sqrt_leg_g
         except Exception as e:
             print(f"Error calculating speeds: {e}")
             return []
-        
-        return bipedal_dinosaurs
+
+        # Sort by speed (descending - fastest first), then materialize
+        # DinosaurData views only for the rows returned. For a top-k
+        # query, argpartition first selects the k fastest in O(n) (the
+        # array equivalent of heapq.nlargest) so only k entries are
+        # sorted.
+        if top_k is not None and top_k < speeds.size:
+            fastest = np.argpartition(-speeds, top_k - 1)[:top_k]
+            order = fastest[np.argsort(-speeds[fastest], kind='stable')]
+        else:
+            order = np.argsort(-speeds, kind='stable')
+
+        result = []
+        for i in order:
+            row = int(bipedal_indices[i])
+            result.append(DinosaurData(
+                name=self.names[row],
+                leg_length=float(self.leg[row]),
+                stride_length=float(self.stride[row]),
+                diet=self.diets[row],
+                stance=str(self.stance[row]),
+                speed=float(speeds[i])
+            ))
+
+        return result
     
     def print_results(self, dinosaurs: List[DinosaurData], show_details: bool = False) -> None:
         """Print the results in a formatted way"""
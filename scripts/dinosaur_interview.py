@@ -13,15 +13,22 @@ import csv
 import math
 
 
-def read_csv_to_dict(filename, key_column):
-    """Read CSV file and return dictionary keyed by specified column"""
-    data = {}
-    with open(filename, 'r') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            key = row[key_column]
-            data[key] = row
-    return data
+def read_csv_columns(filename, key_column, value_columns):
+    """
+    Read CSV file and return {key: tuple of requested column values}
+
+    Column positions are resolved from the header once, so each row is
+    just an index lookup - no per-row dict is built (DictReader would
+    allocate and hash a fresh dict for every row).
+    """
+    with open(filename, 'r', newline='') as file:
+        reader = csv.reader(file)
+        header = [h.strip().upper() for h in next(reader)]
+        key_i = header.index(key_column)
+        value_is = [header.index(c) for c in value_columns]
+        # Blank lines come through csv.reader as [], so skip them
+        return {row[key_i]: tuple(row[i] for i in value_is)
+                for row in reader if row}
 
 
 def calculate_speed(leg_length, stride_length):
@@ -33,30 +40,31 @@ def calculate_speed(leg_length, stride_length):
 def solve_dinosaur_problem(dataset1_file, dataset2_file):
     """Main function to solve the dinosaur speed problem"""
     
-    # Read both datasets
-    dataset1 = read_csv_to_dict(dataset1_file, 'NAME')  # NAME, LEG_LENGTH, DIET
-    dataset2 = read_csv_to_dict(dataset2_file, 'NAME')  # NAME, STRIDE_LENGTH, STANCE
-    
+    # Read both datasets, parsing floats once at load time
+    dataset1 = {name: float(leg)
+                for name, (leg,) in read_csv_columns(dataset1_file, 'NAME', ('LEG_LENGTH',)).items()}
+    dataset2 = {name: (float(stride), stance.lower() == 'bipedal')
+                for name, (stride, stance) in read_csv_columns(dataset2_file, 'NAME', ('STRIDE_LENGTH', 'STANCE')).items()}
+
     bipedal_speeds = []
-    
+
     # Process each dinosaur that appears in both datasets
-    for name in dataset1:
+    for i, (name, leg_length) in enumerate(dataset1.items()):
         if name in dataset2:
-            # Get data from both datasets
-            leg_length = float(dataset1[name]['LEG_LENGTH'])
-            stride_length = float(dataset2[name]['STRIDE_LENGTH'])
-            stance = dataset2[name]['STANCE']
-            
-            # Only process bipedal dinosaurs
-            if stance.lower() == 'bipedal':
+            stride_length, is_bipedal = dataset2[name]
+
+            # Only process bipedal dinosaurs (flag computed at load time)
+            if is_bipedal:
                 speed = calculate_speed(leg_length, stride_length)
-                bipedal_speeds.append((name, speed))
-    
-    # Sort by speed (descending - fastest first)
-    bipedal_speeds.sort(key=lambda x: x[1], reverse=True)
-    
+                bipedal_speeds.append((speed, -i, name))
+
+    # Sort by speed (descending - fastest first); speed leads the tuple
+    # so the sort is plain C tuple comparison with no key callback, and
+    # the negated index keeps equal speeds in input order
+    bipedal_speeds.sort(reverse=True)
+
     # Return just the names in order
-    return [name for name, speed in bipedal_speeds]
+    return [name for speed, _, name in bipedal_speeds]
 
 
 
@@ -80,39 +88,40 @@ def interview_solution():
     
     # Step 1: Read the data
     print("\n1. Reading CSV files...")
-    dataset1 = read_csv_to_dict('dataset1.csv', 'NAME')
-    dataset2 = read_csv_to_dict('dataset2.csv', 'NAME')
+    dataset1 = read_csv_columns('dataset1.csv', 'NAME', ('LEG_LENGTH',))
+    dataset2 = read_csv_columns('dataset2.csv', 'NAME', ('STRIDE_LENGTH', 'STANCE'))
     print(f"   Dataset1 has {len(dataset1)} dinosaurs")
     print(f"   Dataset2 has {len(dataset2)} dinosaurs")
-    
+
     # Step 2: Process and calculate speeds
     print("\n2. Processing dinosaurs...")
     results = []
-    
-    for name in dataset1:
+
+    for order, name in enumerate(dataset1):
         if name in dataset2:
-            leg_length = float(dataset1[name]['LEG_LENGTH'])
-            stride_length = float(dataset2[name]['STRIDE_LENGTH'])
-            stance = dataset2[name]['STANCE']
-            
+            leg_length = float(dataset1[name][0])
+            stride_length, stance = dataset2[name]
+            stride_length = float(stride_length)
+
             print(f"   {name}: leg={leg_length}m, stride={stride_length}m, stance={stance}")
-            
+
             if stance.lower() == 'bipedal':
                 speed = calculate_speed(leg_length, stride_length)
-                results.append((name, speed))
+                results.append((speed, -order, name))
                 print(f"      -> Bipedal! Speed = {speed:.2f} m/s")
             else:
                 print(f"      -> Quadrupedal, skipping")
-    
-    # Step 3: Sort by speed
+
+    # Step 3: Sort by speed (speed-first tuples, no key function needed;
+    # the negated index keeps equal speeds in input order)
     print("\n3. Sorting by speed (fastest first)...")
-    results.sort(key=lambda x: x[1], reverse=True)
-    
+    results.sort(reverse=True)
+
     print("\nFinal result:")
-    for i, (name, speed) in enumerate(results, 1):
+    for i, (speed, _, name) in enumerate(results, 1):
         print(f"{i}. {name} - {speed:.2f} m/s")
-    
-    return [name for name, speed in results]
+
+    return [name for speed, _, name in results]
 
 
 # Uncomment to run interview walkthrough